@@ -11,24 +11,187 @@ const fs = require('fs');
 const path = require('path');
 const https = require('https');
 const http = require('http');
+const zlib = require('zlib');
+const crypto = require('crypto');
 const { URL } = require('url');
-const yaml = require('js-yaml');
-const readline = require('readline');
 const { program } = require('commander');
 
-// Create readline interface for user input
-const rl = readline.createInterface({
-  input: process.stdin,
-  output: process.stdout
-});
+// js-yaml is only needed on the env-file path and readline only when
+// prompting for a token, so both are required lazily to keep plain
+// `--help` invocations from loading them
+
+// Shared keep-alive agents so consecutive API requests reuse one socket
+// instead of paying a fresh TCP (and TLS) handshake per call
+const httpAgent = new http.Agent({ keepAlive: true, maxSockets: 8 });
+const httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 8 });
+
+// Default headers sent with every API request; the API key is set once via
+// configureHttp() after the token is known
+const defaultHeaders = {
+  'Content-Type': 'application/json',
+  // Workflow JSON is highly repetitive; brotli/gzip cut the bytes on the
+  // wire substantially and Node's http client does not negotiate either
+  // encoding by default
+  'Accept-Encoding': 'br, gzip, deflate'
+};
+
+const REQUEST_TIMEOUT_MS = 30000;
+const MAX_RETRIES = 3;
+const RETRY_BACKOFF_MS = 300;
+const RETRYABLE_STATUS_CODES = new Set([502, 503, 504]);
+const ERROR_BODY_LIMIT = 64 * 1024;
+
+// Readline interface for user input, created on first prompt
+let rl = null;
+
+function getReadline() {
+  if (!rl) {
+    const readline = require('readline');
+    rl = readline.createInterface({
+      input: process.stdin,
+      output: process.stdout
+    });
+  }
+  return rl;
+}
+
+function closeReadline() {
+  if (rl) {
+    rl.close();
+    rl = null;
+  }
+}
 
 // Promisify readline question
-const question = (query) => new Promise((resolve) => rl.question(query, resolve));
+const question = (query) => new Promise((resolve) => getReadline().question(query, resolve));
+
+// Memoized result of loadOrCreateEnvVariables so the YAML file is read and
+// parsed at most once per process
+let cachedEnvConfig = null;
+
+// On-disk cache mapping workflow name -> id, so repeat runs can skip the
+// listing request entirely
+const ID_CACHE_PATH = path.join(__dirname, '.workflow_id_cache.json');
+
+/**
+ * Read the workflow-id cache, returning an empty mapping if absent or corrupt
+ */
+function readIdCache() {
+  try {
+    return JSON.parse(fs.readFileSync(ID_CACHE_PATH, 'utf8'));
+  } catch {
+    return {};
+  }
+}
+
+/**
+ * Normalize a cache entry to { id, etag }; entries written before ETag
+ * support were the bare id string
+ */
+function getCacheEntry(cache, workflowName) {
+  if (typeof cache[workflowName] === 'string') {
+    return { id: cache[workflowName], etag: null };
+  }
+  return cache[workflowName] || null;
+}
+
+/**
+ * Fingerprint of a serialized payload, stored next to the cached ETag so
+ * the validator can be tied to the exact bytes previously written
+ */
+function contentFingerprint(buffer) {
+  return {
+    size: buffer.length,
+    sha256: crypto.createHash('sha256').update(buffer).digest('hex')
+  };
+}
+
+/**
+ * True when outputPath is the file the cache entry was recorded for and it
+ * still holds exactly the fingerprinted bytes
+ */
+function matchesFingerprint(outputPath, entry) {
+  if (!entry || !entry.sha256 || entry.file !== outputPath) {
+    return false;
+  }
+
+  try {
+    const current = fs.readFileSync(outputPath);
+    return current.length === entry.size
+      && crypto.createHash('sha256').update(current).digest('hex') === entry.sha256;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Persist the workflow-id cache; best-effort, failures are ignored
+ */
+function writeIdCache(cache) {
+  try {
+    fs.writeFileSync(ID_CACHE_PATH, JSON.stringify(cache, null, 2));
+  } catch {
+    // The cache only saves a round-trip; never fail the download over it
+  }
+}
 
 /**
  * Load or create environment variables from .env.local.yml file
  */
 async function loadOrCreateEnvVariables() {
+  if (cachedEnvConfig) {
+    return cachedEnvConfig;
+  }
+
+  cachedEnvConfig = await loadOrCreateEnvVariablesUncached();
+  return cachedEnvConfig;
+}
+
+// Fast-path extractors for the only two keys the tool reads; the env file is
+// a two-key mapping, so a regex scan of the raw text covers the common case
+// without a YAML parse
+const API_TOKEN_RE = /^\s+API_TOKEN:\s*['"]?([^\s'"#]+)/m;
+const INSTANCE_URL_RE = /^\s+INSTANCE_URL:\s*['"]?([^\s'"#]+)/m;
+
+/**
+ * Extract the N8N api token and instance URL from raw .env.local.yml text
+ */
+function extractN8nConfig(rawText) {
+  const tokenMatch = API_TOKEN_RE.exec(rawText);
+  if (tokenMatch) {
+    const urlMatch = INSTANCE_URL_RE.exec(rawText);
+    return {
+      apiToken: tokenMatch[1],
+      instanceUrl: urlMatch ? urlMatch[1] : null
+    };
+  }
+
+  // Fall back to a full YAML parse for layouts the regex does not cover.
+  // JSON_SCHEMA skips the extra implicit-type resolvers (timestamps, merge
+  // keys, ...) that the default schema runs on every scalar
+  const yaml = require('js-yaml');
+  const envData = yaml.load(rawText, { schema: yaml.JSON_SCHEMA });
+  if (envData && typeof envData === 'object' && envData.N8N && typeof envData.N8N === 'object') {
+    return {
+      apiToken: envData.N8N.API_TOKEN || null,
+      instanceUrl: envData.N8N.INSTANCE_URL || null
+    };
+  }
+
+  return { apiToken: null, instanceUrl: null };
+}
+
+async function loadOrCreateEnvVariablesUncached() {
+  // CI and other non-TTY runs configure via environment variables; when the
+  // token is set, skip the file read and the interactive prompt entirely
+  const envToken = process.env.N8N_API_TOKEN;
+  if (envToken) {
+    return {
+      n8n_api_token: envToken,
+      n8n_instance_url: process.env.N8N_INSTANCE_URL || 'http://127.0.0.1:5678'
+    };
+  }
+
   const envPath = path.join(__dirname, '.env.local.yml');
 
   // Default configuration
@@ -37,24 +200,19 @@ async function loadOrCreateEnvVariables() {
     n8n_instance_url: 'http://127.0.0.1:5678'
   };
 
-  // Try to load existing file
-  if (fs.existsSync(envPath)) {
-    try {
-      const envData = yaml.load(fs.readFileSync(envPath, 'utf8'));
-
-      if (envData && typeof envData === 'object') {
-        // Extract N8N configuration
-        if (envData.N8N && typeof envData.N8N === 'object') {
-          config.n8n_api_token = envData.N8N.API_TOKEN;
-          config.n8n_instance_url = envData.N8N.INSTANCE_URL || config.n8n_instance_url;
-        }
+  // Try to load existing file; reading directly and treating ENOENT as "no
+  // file yet" saves the separate exists() stat before the open
+  try {
+    const { apiToken, instanceUrl } = extractN8nConfig(fs.readFileSync(envPath, 'utf8'));
+    config.n8n_api_token = apiToken;
+    config.n8n_instance_url = instanceUrl || config.n8n_instance_url;
 
-        // Check if we have a valid n8n API token
-        if (config.n8n_api_token && config.n8n_api_token !== 'your_n8n_api_token_here') {
-          return config;
-        }
-      }
-    } catch (e) {
+    // Check if we have a valid n8n API token
+    if (config.n8n_api_token && config.n8n_api_token !== 'your_n8n_api_token_here') {
+      return config;
+    }
+  } catch (e) {
+    if (e.code !== 'ENOENT') {
       console.log(`Warning: Error reading existing .env.local.yml: ${e.message}`);
     }
   }
@@ -87,7 +245,19 @@ async function loadOrCreateEnvVariables() {
   };
 
   try {
-    fs.writeFileSync(envPath, yaml.dump(envData));
+    const yaml = require('js-yaml');
+
+    // Write to a temp file in the same directory and rename it into place so
+    // an interrupt can never leave a truncated token file behind
+    const tmpPath = `${envPath}.${process.pid}.tmp`;
+    const fd = fs.openSync(tmpPath, 'w');
+    try {
+      fs.writeSync(fd, yaml.dump(envData, { schema: yaml.JSON_SCHEMA }));
+      fs.fsyncSync(fd);
+    } finally {
+      fs.closeSync(fd);
+    }
+    fs.renameSync(tmpPath, envPath);
     console.log(`\n✅ API token saved to ${envPath}`);
   } catch (e) {
     console.log(`\n⚠️  Warning: Could not save API token to file: ${e.message}`);
@@ -98,54 +268,151 @@ async function loadOrCreateEnvVariables() {
 }
 
 /**
- * Make HTTP request
+ * Bind the n8n API token to the shared default headers
  */
-function makeRequest(url, options) {
+function configureHttp(apiToken) {
+  defaultHeaders['X-N8N-API-KEY'] = apiToken;
+}
+
+/**
+ * Sleep for the given number of milliseconds
+ */
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Wrap a response stream with the decompressor matching its Content-Encoding
+ */
+function decodeResponse(res) {
+  const encoding = (res.headers['content-encoding'] || '').trim();
+
+  if (encoding === 'br') {
+    return res.pipe(zlib.createBrotliDecompress());
+  }
+  if (encoding === 'gzip') {
+    return res.pipe(zlib.createGunzip());
+  }
+  if (encoding === 'deflate') {
+    return res.pipe(zlib.createInflate());
+  }
+
+  return res;
+}
+
+/**
+ * Make a single HTTP request over the shared keep-alive agent.
+ *
+ * Resolves with { statusCode, headers, body }; 2xx JSON bodies are parsed,
+ * and a 304 Not Modified resolves with a null body so callers can keep
+ * their local copy.
+ */
+function makeRequestOnce(url, options) {
   return new Promise((resolve, reject) => {
     const parsedUrl = new URL(url);
     const client = parsedUrl.protocol === 'https:' ? https : http;
 
-    const req = client.request(url, options, (res) => {
+    const requestOptions = {
+      ...options,
+      agent: parsedUrl.protocol === 'https:' ? httpsAgent : httpAgent,
+      headers: { ...defaultHeaders, ...(options.headers || {}) }
+    };
+
+    const req = client.request(url, requestOptions, (res) => {
+      if (res.statusCode === 304) {
+        res.resume();
+        resolve({ statusCode: res.statusCode, headers: res.headers, body: null });
+        return;
+      }
+
+      const body = decodeResponse(res);
+      const isError = res.statusCode < 200 || res.statusCode >= 300;
       let data = '';
 
-      res.on('data', (chunk) => {
-        data += chunk;
+      body.on('data', (chunk) => {
+        // Error bodies are only used for diagnostics, so keep a bounded
+        // prefix instead of buffering an arbitrarily large response
+        if (!isError || data.length < ERROR_BODY_LIMIT) {
+          data += chunk;
+        }
       });
 
-      res.on('end', () => {
-        if (res.statusCode >= 200 && res.statusCode < 300) {
+      body.on('error', reject);
+
+      body.on('end', () => {
+        if (!isError) {
+          let parsed;
           try {
-            resolve(JSON.parse(data));
+            parsed = JSON.parse(data);
           } catch (e) {
-            resolve(data);
+            parsed = data;
           }
+          resolve({ statusCode: res.statusCode, headers: res.headers, body: parsed });
         } else {
           const error = new Error(`HTTP ${res.statusCode}`);
           error.response = {
             statusCode: res.statusCode,
-            data: data
+            data: data.slice(0, ERROR_BODY_LIMIT)
           };
           reject(error);
         }
       });
     });
 
+    req.setTimeout(REQUEST_TIMEOUT_MS, () => {
+      req.destroy(new Error(`Request timed out after ${REQUEST_TIMEOUT_MS}ms`));
+    });
+
     req.on('error', reject);
     req.end();
   });
 }
 
 /**
- * Test if the API connection works
+ * Run a request function, retrying transient gateway errors with backoff
  */
-async function testApiConnection(baseUrl, apiToken) {
-  const headers = {
-    'X-N8N-API-KEY': apiToken,
-    'Content-Type': 'application/json'
-  };
+async function withRetries(fn) {
+  let lastError;
+
+  for (let attempt = 0; attempt < MAX_RETRIES; attempt++) {
+    if (attempt > 0) {
+      await sleep(RETRY_BACKOFF_MS * 2 ** (attempt - 1));
+    }
+
+    try {
+      return await fn();
+    } catch (e) {
+      lastError = e;
+      const statusCode = e.response && e.response.statusCode;
+      if (statusCode && !RETRYABLE_STATUS_CODES.has(statusCode)) {
+        throw e;
+      }
+    }
+  }
+
+  throw lastError;
+}
 
+/**
+ * Make HTTP request, resolving with the parsed response body
+ */
+async function makeRequest(url, options = {}) {
+  const response = await withRetries(() => makeRequestOnce(url, options));
+  return response.body;
+}
+
+/**
+ * Make HTTP request, resolving with the full { statusCode, headers, body }
+ * envelope; used where ETag revalidation needs the status and headers
+ */
+function makeConditionalRequest(url, options = {}) {
+  return withRetries(() => makeRequestOnce(url, options));
+}
+
+/**
+ * Test if the API connection works
+ */
+async function testApiConnection(baseUrl) {
   try {
-    await makeRequest(`${baseUrl}/api/v1/workflows`, { headers });
+    await makeRequest(`${baseUrl}/api/v1/workflows`);
     return true;
   } catch (e) {
     console.log('\n❌ API Connection Test Failed:');
@@ -163,24 +430,44 @@ async function testApiConnection(baseUrl, apiToken) {
 }
 
 /**
- * Fetch workflow by name from n8n API
+ * Resolve a workflow name to its id via the n8n API
  */
-async function getWorkflowByName(baseUrl, apiToken, workflowName) {
-  const headers = {
-    'X-N8N-API-KEY': apiToken,
-    'Content-Type': 'application/json'
-  };
-
+async function resolveWorkflowId(baseUrl, workflowName) {
   try {
-    // Get all workflows
-    const workflows = await makeRequest(`${baseUrl}/api/v1/workflows`, { headers });
-
-    // Find the workflow by name
+    // Filter by name on the server so only the matching workflow is
+    // transferred instead of the full workflow list
     let targetWorkflow = null;
-    for (const workflow of workflows.data || []) {
-      if (workflow.name === workflowName) {
-        targetWorkflow = workflow;
-        break;
+    let needFullScan = false;
+
+    try {
+      const listUrl = `${baseUrl}/api/v1/workflows?name=${encodeURIComponent(workflowName)}&limit=1`;
+      const workflows = await makeRequest(listUrl);
+      const candidate = (workflows.data || [])[0] || null;
+
+      // Servers that silently ignore the name filter return an arbitrary
+      // first workflow, so only trust an exact name match; a mismatch means
+      // the filter was not applied and the full list must be scanned
+      if (candidate && candidate.name === workflowName) {
+        targetWorkflow = candidate;
+      } else if (candidate) {
+        needFullScan = true;
+      }
+    } catch (e) {
+      // Older n8n versions reject the name filter; fall back to scanning
+      // the full list
+      if (!e.response || e.response.statusCode !== 400) {
+        throw e;
+      }
+      needFullScan = true;
+    }
+
+    if (!targetWorkflow && needFullScan) {
+      const workflows = await makeRequest(`${baseUrl}/api/v1/workflows`);
+      for (const workflow of workflows.data || []) {
+        if (workflow.name === workflowName) {
+          targetWorkflow = workflow;
+          break;
+        }
       }
     }
 
@@ -188,11 +475,7 @@ async function getWorkflowByName(baseUrl, apiToken, workflowName) {
       throw new Error(`Workflow '${workflowName}' not found`);
     }
 
-    // Get the full workflow details
-    const workflowId = targetWorkflow.id;
-    const workflowDetails = await makeRequest(`${baseUrl}/api/v1/workflows/${workflowId}`, { headers });
-
-    return workflowDetails;
+    return targetWorkflow.id;
 
   } catch (e) {
     let errorMsg = `Error fetching workflow: ${e.message}`;
@@ -211,25 +494,168 @@ async function getWorkflowByName(baseUrl, apiToken, workflowName) {
 }
 
 /**
- * Save workflow data to JSON file
+ * Download a workflow from n8n
  */
-function saveWorkflowJson(workflowData, outputPath) {
-  const dir = path.dirname(outputPath);
-  if (!fs.existsSync(dir)) {
-    fs.mkdirSync(dir, { recursive: true });
+async function downloadWorkflow(baseUrl, workflowName, outputPath) {
+  console.log(`\n📥 Downloading workflow '${workflowName}'...`);
+
+  const cache = readIdCache();
+  const cached = getCacheEntry(cache, workflowName);
+
+  // Fetch the detail response, revalidating with the cached ETag only when
+  // the target file still holds the exact bytes recorded when that ETag was
+  // cached — a 304 can then only ever validate the content it was issued
+  // for. A different output path or an edited file gets an unconditional GET.
+  const fetchDetail = (id, etag) => {
+    const headers = {};
+    if (etag && matchesFingerprint(outputPath, cached)) {
+      headers['If-None-Match'] = etag;
+    }
+    return makeConditionalRequest(`${baseUrl}/api/v1/workflows/${id}`, { headers });
+  };
+
+  // A cached id lets us skip the listing request; a stale id surfaces as a
+  // 404 on the detail endpoint and falls through to re-resolution below
+  let workflowId = cached && cached.id;
+  let result = null;
+
+  if (workflowId) {
+    try {
+      result = await fetchDetail(workflowId, cached.etag);
+    } catch (e) {
+      if (!e.response || e.response.statusCode !== 404) {
+        throw e;
+      }
+      workflowId = null;
+    }
+  }
+
+  if (!result) {
+    // With includeData the name-filtered listing already carries the full
+    // workflow, collapsing list + detail into one round-trip
+    try {
+      const listUrl = `${baseUrl}/api/v1/workflows?name=${encodeURIComponent(workflowName)}&limit=1&includeData=true`;
+      const listing = await makeRequest(listUrl);
+      const workflow = (listing.data || [])[0];
+
+      // Only trust an exact name match here too; a server that ignores the
+      // name filter would otherwise hand us an arbitrary workflow to save
+      if (workflow && workflow.nodes && workflow.name === workflowName) {
+        const buffer = saveWorkflowJson(workflow, outputPath);
+        cache[workflowName] = {
+          id: workflow.id,
+          etag: null,
+          file: outputPath,
+          ...contentFingerprint(buffer)
+        };
+        writeIdCache(cache);
+        console.log('✅ Download completed!');
+        return;
+      }
+    } catch (e) {
+      // Older n8n versions reject includeData; use the two-step path
+      if (!e.response || e.response.statusCode !== 400) {
+        throw e;
+      }
+    }
+
+    workflowId = await resolveWorkflowId(baseUrl, workflowName);
+    result = await fetchDetail(workflowId, null);
+  }
+
+  if (result.statusCode === 304) {
+    // The existing entry's ETag and fingerprint still describe the file
+    cache[workflowName] = { ...cached, id: workflowId };
+    writeIdCache(cache);
+    console.log(`Workflow unchanged, keeping: ${outputPath}`);
+  } else {
+    // The parsed body goes through the same stringify the listing paths
+    // use, so every path writes an identical representation
+    const buffer = saveWorkflowJson(result.body, outputPath);
+    cache[workflowName] = {
+      id: workflowId,
+      etag: result.headers.etag || null,
+      file: outputPath,
+      ...contentFingerprint(buffer)
+    };
+    writeIdCache(cache);
   }
+  console.log('✅ Download completed!');
+}
+
+/**
+ * Save workflow data to JSON file; returns the serialized buffer so callers
+ * can fingerprint exactly what was written
+ */
+function saveWorkflowJson(workflowData, outputPath) {
+  // Serialize once into a buffer so the payload leaves in a single write();
+  // recursive mkdir is a no-op when the directory exists, which saves the
+  // separate exists() stat
+  const buffer = Buffer.from(JSON.stringify(workflowData, null, 2));
+  fs.mkdirSync(path.dirname(outputPath), { recursive: true });
+
+  // Write to a sibling temp file and rename it into place so an interrupt
+  // can never leave a truncated file at outputPath or clobber the previous
+  // good copy
+  const tmpPath = `${outputPath}.${process.pid}.tmp`;
+  fs.writeFileSync(tmpPath, buffer, { mode: 0o644 });
+  fs.renameSync(tmpPath, outputPath);
 
-  fs.writeFileSync(outputPath, JSON.stringify(workflowData, null, 2), 'utf8');
   console.log(`Workflow saved to: ${outputPath}`);
+  return buffer;
 }
 
 /**
- * Download a workflow from n8n
+ * Download several workflows with one coalesced listing request
  */
-async function downloadWorkflow(baseUrl, apiToken, workflowName, outputPath) {
-  console.log(`\n📥 Downloading workflow '${workflowName}'...`);
-  const workflowData = await getWorkflowByName(baseUrl, apiToken, workflowName);
-  saveWorkflowJson(workflowData, outputPath);
+async function downloadWorkflowsBatch(baseUrl, names, outputDir) {
+  console.log(`\n📥 Downloading ${names.length} workflows in one batch...`);
+
+  const cache = readIdCache();
+
+  // Resolve every name to an id, hitting the listing endpoint only for
+  // names missing from the cache
+  const ids = await Promise.all(names.map(async (name) => {
+    const cached = getCacheEntry(cache, name);
+    if (cached && cached.id) {
+      return cached.id;
+    }
+
+    const id = await resolveWorkflowId(baseUrl, name);
+    cache[name] = { id, etag: null };
+    return id;
+  }));
+  writeIdCache(cache);
+
+  // One request fetches all requested workflows together instead of a
+  // detail round-trip per workflow
+  let listing;
+  try {
+    listing = await makeRequest(`${baseUrl}/api/v1/workflows?ids=${ids.map(encodeURIComponent).join(',')}&includeData=true`);
+  } catch (e) {
+    // Older n8n versions reject the ids filter; fall back to per-workflow
+    // downloads
+    if (!e.response || e.response.statusCode !== 400) {
+      throw e;
+    }
+    await Promise.all(names.map((name) => downloadWorkflow(baseUrl, name, path.join(outputDir, `${name}.json`))));
+    return;
+  }
+
+  const workflowsById = new Map((listing.data || []).map((workflow) => [workflow.id, workflow]));
+
+  await Promise.all(names.map((name, i) => {
+    const workflow = workflowsById.get(ids[i]);
+    if (!workflow || !workflow.nodes) {
+      // Stale cached id, or a server that ignores includeData; the
+      // per-workflow path re-resolves and fetches the detail
+      return downloadWorkflow(baseUrl, name, path.join(outputDir, `${name}.json`));
+    }
+
+    saveWorkflowJson(workflow, path.join(outputDir, `${name}.json`));
+    return Promise.resolve();
+  }));
+
   console.log('✅ Download completed!');
 }
 
@@ -239,11 +665,28 @@ async function downloadWorkflow(baseUrl, apiToken, workflowName, outputPath) {
 async function downloadCommand(options, config) {
   // Use URL from options or fall back to config
   const baseUrl = options.url || config.n8n_instance_url;
-  const apiToken = config.n8n_api_token;
 
-  // Test connection
+  // Bind the API token to the shared request headers once
+  configureHttp(config.n8n_api_token);
+
+  // Get the script directory
+  const scriptDir = __dirname;
+
+  // Start the downloads while the connectivity probe is still in flight;
+  // both hit the same API, so the probe no longer costs a serial round-trip.
+  // Each worker fetches and saves its own workflow so network and disk I/O
+  // overlap too.
   console.log(`\n🔌 Connecting to n8n at ${baseUrl}...`);
-  if (!await testApiConnection(baseUrl, apiToken)) {
+  const names = Array.isArray(options.name) ? options.name : [options.name];
+
+  // A single workflow keeps the streaming + ETag fast path; several
+  // workflows are coalesced into one batched listing request
+  const tasks = names.length === 1
+    ? [downloadWorkflow(baseUrl, names[0], path.join(scriptDir, options.file))]
+    : [downloadWorkflowsBatch(baseUrl, names, scriptDir)];
+  const downloads = Promise.allSettled(tasks);
+
+  if (!await testApiConnection(baseUrl)) {
     console.log('❌ Failed to connect to n8n. Please check:');
     console.log('   - n8n is running at the specified URL');
     console.log('   - The API token is valid');
@@ -251,14 +694,31 @@ async function downloadCommand(options, config) {
   }
   console.log('✅ Connected successfully!');
 
-  // Get the script directory and set file path
-  const scriptDir = __dirname;
-  const filePath = path.join(scriptDir, options.file);
-
-  // Download the workflow
-  await downloadWorkflow(baseUrl, apiToken, options.name, filePath);
+  const failed = (await downloads).find((result) => result.status === 'rejected');
+  if (failed) {
+    throw failed.reason;
+  }
 }
 
+// Usage examples shown after the generated help text
+const HELP_EPILOG = `
+Examples:
+  # Download workflow from n8n
+  node e2e.js download
+
+  # Use custom n8n URL
+  node e2e.js download --url http://n8n.example.com:5678
+
+  # Use custom workflow name
+  node e2e.js download --name my-custom-workflow
+
+  # Download several workflows concurrently
+  node e2e.js download --name workflow-one workflow-two
+
+  # Use custom output file
+  node e2e.js download --file my-workflow.json
+  `;
+
 /**
  * Main function
  */
@@ -272,36 +732,23 @@ async function main() {
     .command('download')
     .description('Download workflow from n8n instance')
     .option('--url <url>', 'n8n instance URL (overrides .env.local.yml)')
-    .option('--file <file>', 'Output workflow JSON file name', 'n8n-nodes-binalyze-air-e2e.json')
-    .option('--name <name>', 'Workflow name to download', 'n8n-nodes-binalyze-air-e2e')
+    .option('--file <file>', 'Output workflow JSON file name (single workflow only)', 'n8n-nodes-binalyze-air-e2e.json')
+    .option('--name <names...>', 'Workflow name(s) to download', ['n8n-nodes-binalyze-air-e2e'])
     .action(async (options) => {
       try {
         console.log('🔧 n8n Workflow Download Tool');
         console.log('='.repeat(40));
         const config = await loadOrCreateEnvVariables();
         await downloadCommand(options, config);
-        rl.close();
+        closeReadline();
       } catch (error) {
         console.error(`\n❌ Error: ${error.message}`);
-        rl.close();
+        closeReadline();
         process.exit(1);
       }
     });
 
-  program.addHelpText('after', `
-Examples:
-  # Download workflow from n8n
-  node e2e.js download
-
-  # Use custom n8n URL
-  node e2e.js download --url http://n8n.example.com:5678
-
-  # Use custom workflow name
-  node e2e.js download --name my-custom-workflow
-
-  # Use custom output file
-  node e2e.js download --file my-workflow.json
-  `);
+  program.addHelpText('after', HELP_EPILOG);
 
   // Parse command line arguments
   program.parse(process.argv);
@@ -309,7 +756,6 @@ Examples:
   // Show help if no command provided
   if (!process.argv.slice(2).length) {
     program.outputHelp();
-    rl.close();
   }
 }
 